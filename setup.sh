@@ -37,7 +37,7 @@ echo "Setting up Python environment..."
 cd /Users/christiangarcia/thermal_logger
 python3 -m venv venv
 source venv/bin/activate
-pip install opencv-python numpy pyusb pandas
+pip install opencv-python numpy pyusb
 
 # Fix USB permissions
 echo "Fixing USB permissions..."
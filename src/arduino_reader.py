@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
+import select
 import serial
 import time
 import os
 from datetime import datetime
+from config import GPS_RE, RTC_RE
 from data_logger import DataLogger
 
 class ArduinoReader:
@@ -11,6 +13,7 @@ class ArduinoReader:
         self.port = port
         self.baud_rate = baud_rate
         self.serial = None
+        self._poll = None
         self.logger = DataLogger()
         self.connected = False
 
@@ -18,6 +21,8 @@ class ArduinoReader:
         """Attempt to connect to Arduino"""
         try:
             self.serial = serial.Serial(self.port, self.baud_rate, timeout=1)
+            self._poll = select.poll()
+            self._poll.register(self.serial.fileno(), select.POLLIN)
             self.connected = True
             print(f"Connected to Arduino on {self.port}")
             return True
@@ -44,30 +49,27 @@ class ArduinoReader:
         return False
 
     def process_data(self, line):
-        """Process incoming data from Arduino"""
+        """Process an incoming line (raw bytes) from Arduino"""
         try:
-            parts = line.split(',')
-            if len(parts) < 2 or parts[0] != 'DATA':
-                return
-
-            data_type = parts[1]
-            
-            if data_type == 'GPS' and len(parts) >= 7:
+            m = GPS_RE.match(line)
+            if m:
                 # GPS data format: DATA,GPS,timestamp,lat,lon,alt,sats
                 gps_data = {
-                    'timestamp': parts[2],
-                    'latitude': float(parts[3]),
-                    'longitude': float(parts[4]),
-                    'altitude': float(parts[5]),
-                    'satellites': int(parts[6])
+                    'timestamp': m.group(1).decode('ascii', 'replace'),
+                    'latitude': float(m.group(2)),
+                    'longitude': float(m.group(3)),
+                    'altitude': float(m.group(4)),
+                    'satellites': int(m.group(5))
                 }
                 self.logger.log_data('gps', gps_data)
                 print(f"Logged GPS: {gps_data['latitude']}, {gps_data['longitude']}")
+                return
 
-            elif data_type == 'RTC' and len(parts) >= 3:
+            m = RTC_RE.match(line)
+            if m:
                 # RTC data format: DATA,RTC,timestamp
                 rtc_data = {
-                    'timestamp': parts[2]
+                    'timestamp': m.group(1).decode('ascii', 'replace')
                 }
                 self.logger.log_data('time', rtc_data)
                 print(f"Logged RTC: {rtc_data['timestamp']}")
@@ -84,11 +86,13 @@ class ArduinoReader:
         print("Starting Arduino data collection...")
         while True:
             try:
-                if self.serial.in_waiting:
-                    line = self.serial.readline().decode('utf-8').strip()
+                # Block until the port is readable instead of polling on a timer
+                if not self._poll.poll(1000):
+                    continue
+                while self.serial.in_waiting:
+                    line = self.serial.readline().strip()
                     if line:
                         self.process_data(line)
-                time.sleep(0.1)  # Prevent CPU overuse
 
             except KeyboardInterrupt:
                 print("\nStopping data collection...")
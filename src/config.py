@@ -4,6 +4,7 @@ Edit these settings to customize the system behavior.
 """
 
 import os
+import re
 
 # Base directory for the project (automatically set)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -28,6 +29,11 @@ ARDUINO_CONFIG = {
     ]
 }
 
+# Arduino DATA line formats, shared by arduino_reader.py and serial_logger.py.
+# Matched against the raw serial bytes, so lines are never decoded or split.
+GPS_RE = re.compile(rb"DATA,GPS,([^,]*),([^,]+),([^,]+),([^,]+),([^,]+)")  # timestamp,lat,lon,alt,sats
+RTC_RE = re.compile(rb"DATA,RTC,([^,]*)")                                 # timestamp
+
 # Data collection intervals (in seconds)
 INTERVALS = {
     'gps': 6,        # GPS data collection interval
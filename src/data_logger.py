@@ -1,7 +1,12 @@
-import pandas as pd
+import atexit
+import csv
+import time
 from datetime import datetime
 import os
 
+FLUSH_ROWS = 128        # flush a data type's buffer once this many rows are pending
+FLUSH_INTERVAL = 1.0    # ...or once this many seconds have passed since its last flush
+
 class DataLogger:
     def __init__(self, base_dir='data'):
         self.base_dir = base_dir
@@ -11,45 +16,91 @@ class DataLogger:
             'time': os.path.join(base_dir, 'time_stamp'),
             'received': os.path.join(base_dir, 'received_data')
         }
-        
+
         # Create directories if they don't exist
         for directory in self.data_dirs.values():
             if not os.path.exists(directory):
                 os.makedirs(directory)
 
+        self._paths = {dtype: os.path.join(directory, f'log_{dtype}.csv')
+                       for dtype, directory in self.data_dirs.items()}
+
+        # Per data type: open file, csv writer, column order, pending rows, last flush time
+        self._files = {}
+        self._writers = {}
+        self._columns = {}
+        self._buffers = {dtype: [] for dtype in self.data_dirs}
+        self._last_flush = {dtype: time.monotonic() for dtype in self.data_dirs}
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open(self, data_type, columns):
+        """Open the CSV for a data type once and write its header if the file is new"""
+        f = open(self._paths[data_type], 'a', newline='', buffering=1 << 16)
+        writer = csv.writer(f)
+        if f.tell() == 0:   # checked at open time, so a file created or rotated since init is handled
+            writer.writerow(columns)
+        self._files[data_type] = f
+        self._writers[data_type] = writer
+        self._columns[data_type] = columns
+
     def log_data(self, data_type, data):
-        """Log data to appropriate CSV file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
+        """Buffer a dict of values for the data type's CSV file"""
         if data_type not in self.data_dirs:
             raise ValueError(f"Unknown data type: {data_type}")
-            
-        filename = os.path.join(self.data_dirs[data_type], f'log_{data_type}.csv')
-        
-        # Convert data to DataFrame if it's not already
-        if not isinstance(data, pd.DataFrame):
-            data = pd.DataFrame([data])
-            
+
         # Add timestamp if not present
-        if 'timestamp' not in data.columns:
-            data['timestamp'] = timestamp
-            
-        # Append to CSV
-        data.to_csv(filename, mode='a', header=not os.path.exists(filename), index=False)
-        
-        return filename
+        if 'timestamp' not in data:
+            data = dict(data, timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"))
+
+        if data_type not in self._writers:
+            self._open(data_type, list(data))
+
+        buffer = self._buffers[data_type]
+        buffer.append(tuple(data.get(k, '') for k in self._columns[data_type]))
+
+        if (len(buffer) >= FLUSH_ROWS or
+                time.monotonic() - self._last_flush[data_type] > FLUSH_INTERVAL):
+            self.flush(data_type)
+
+        return self._files[data_type].name
+
+    def flush(self, data_type=None):
+        """Write pending rows to disk (all data types if none given)"""
+        for dtype in ([data_type] if data_type else list(self._writers)):
+            buffer = self._buffers[dtype]
+            if buffer and dtype in self._writers:
+                self._writers[dtype].writerows(buffer)
+                self._files[dtype].flush()
+                buffer.clear()
+            self._last_flush[dtype] = time.monotonic()
+
+    def close(self):
+        """Flush pending rows and close all open CSV files"""
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        self._writers.clear()
+        self._columns.clear()
 
     def read_data(self, data_type, start_time=None, end_time=None):
-        """Read data from CSV files within specified time range"""
-        filename = os.path.join(self.data_dirs[data_type], f'log_{data_type}.csv')
-        
+        """Read rows (as dicts) from CSV files within specified time range"""
+        self.flush(data_type)
+        filename = self._paths[data_type]
+
         if not os.path.exists(filename):
-            return pd.DataFrame()
-            
-        data = pd.read_csv(filename)
-        
+            return []
+
+        with open(filename, newline='') as f:
+            data = list(csv.DictReader(f))
+
         if start_time and end_time:
-            mask = (data['timestamp'] >= start_time) & (data['timestamp'] <= end_time)
-            data = data[mask]
-            
+            data = [row for row in data if start_time <= row['timestamp'] <= end_time]
+
         return data
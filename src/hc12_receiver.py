@@ -1,3 +1,4 @@
+import select
 import serial
 import time
 import os
@@ -19,9 +20,10 @@ class HC12:
             timeout=1
         )
 
-    def read_data(self):
-        """Read data from HC-12"""
-        if self.ser.in_waiting:
+    def read_data(self, timeout=0):
+        """Read data from HC-12, waiting up to `timeout` seconds (None blocks)"""
+        ready, _, _ = select.select([self.ser], [], [], timeout)
+        if ready:
             return self.ser.readline().decode('utf-8').strip()
         return None
 
@@ -13,9 +13,10 @@ import os
 import sys
 import re
 import csv
+import select
 import time
 import logging
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import cv2
@@ -29,6 +30,8 @@ IMAGE_FORMAT     = "png"
 JPEG_QUALITY     = 90
 HOT_BOX_SIZE     = 24
 PREVIEW          = True
+# OpenCV worker threads; 160x120 Lepton frames cost less than the thread-pool dispatch
+CV_THREADS       = int(os.environ.get("THERMAL_CV_THREADS", "1"))
 
 # HUD tuning (small)
 HUD_FONT         = cv2.FONT_HERSHEY_SIMPLEX
@@ -40,6 +43,7 @@ HUD_MIN_SCALE    = 0.30
 
 BASE_DIR  = os.path.dirname(__file__)
 DATA_ROOT = os.path.join(BASE_DIR, "data", "flir_lepton")
+LAUNCH_RE = re.compile(r"launch(\d{2})")
 
 # Optional GPS (safe if missing)
 try:
@@ -54,14 +58,11 @@ except Exception:
 def next_launch_dir(root: str) -> str:
     os.makedirs(root, exist_ok=True)
     nums = []
-    for name in os.listdir(root):
-        if os.path.isdir(os.path.join(root, name)):
-            m = re.fullmatch(r"launch(\d{2})", name)
-            if m:
-                try:
-                    nums.append(int(m.group(1)))
-                except Exception:
-                    pass
+    with os.scandir(root) as it:
+        for entry in it:
+            m = LAUNCH_RE.fullmatch(entry.name)
+            if m and entry.is_dir():
+                nums.append(int(m.group(1)))
     n = max(nums) + 1 if nums else 1
     path = os.path.join(root, f"launch{n:02d}")
     os.makedirs(path, exist_ok=True)
@@ -70,44 +71,97 @@ def next_launch_dir(root: str) -> str:
 def utcstamp() -> str:
     return datetime.utcnow().strftime("%Y%m%d_%H%M%S")
 
-def hottest_box(metric_img: np.ndarray, box: int):
-    img = metric_img.astype(np.float32, copy=False)
-    img = cv2.GaussianBlur(img, (3, 3), 0)
-    _, _, _, loc = cv2.minMaxLoc(img)
-    cx, cy = int(loc[0]), int(loc[1])
-    h, w = img.shape[:2]
+def hottest_box(metric_img: np.ndarray, box: int, tmp_buf: np.ndarray = None):
+    # 3x3 mean locates the hot spot robustly; tmp_buf (float32, same shape) avoids a per-frame alloc.
+    # Callers pass float32; anything else is converted once here.
+    if metric_img.dtype != np.float32:
+        metric_img = metric_img.astype(np.float32)
+    h, w = metric_img.shape[:2]
+    tmp_buf = cv2.boxFilter(metric_img, cv2.CV_32F, (3, 3), dst=tmp_buf, normalize=True)
+    cy, cx = divmod(int(tmp_buf.argmax()), w)
     half = max(2, box // 2)
     x1 = max(0, cx - half); y1 = max(0, cy - half)
     x2 = min(w, cx + half); y2 = min(h, cy + half)
-    roi = img[y1:y2, x1:x2]
+    roi = metric_img[y1:y2, x1:x2]
     return {"min": float(roi.min()), "max": float(roi.max()), "mean": float(roi.mean()),
             "x1": x1, "y1": y1, "x2": x2, "y2": y2}
 
+def tmp_path_for(final_path: str) -> str:
+    # fixed per-target name; saves are serialized on one worker so it never collides
+    d, name = os.path.split(final_path)
+    return os.path.join(d, ".tmp_" + name)
+
 def atomic_save(img: np.ndarray, final_path: str) -> bool:
-    fd, tmp = tempfile.mkstemp(prefix=".tmp_", suffix=os.path.splitext(final_path)[1],
-                               dir=os.path.dirname(final_path))
-    os.close(fd)
+    # encode in memory, then one write + fsync on the same fd before the rename
+    ext = os.path.splitext(final_path)[1].lower()
+    params = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY] if ext in (".jpg", ".jpeg") else []
+    ok, buf = cv2.imencode(ext, img, params)
+    if not ok or buf.size == 0:
+        return False
+    tmp = tmp_path_for(final_path)
     try:
-        if final_path.lower().endswith((".jpg", ".jpeg")):
-            ok = cv2.imwrite(tmp, img, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
-        else:
-            ok = cv2.imwrite(tmp, img)
-        if not ok or os.path.getsize(tmp) == 0:
-            os.remove(tmp); return False
-        probe = cv2.imread(tmp, cv2.IMREAD_UNCHANGED)
-        if probe is None:
-            os.remove(tmp); return False
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(buf.reshape(-1))
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(tmp, final_path)
         return True
+    except OSError:
+        return False
     finally:
         try:
-            if os.path.exists(tmp): os.remove(tmp)
-        except Exception:
+            os.remove(tmp)
+        except OSError:
             pass
 
+def save_with_retry(img: np.ndarray, final_path: str) -> bool:
+    if atomic_save(img, final_path):
+        return True
+    time.sleep(0.2)
+    return atomic_save(img, final_path)
+
+def on_save_done(final_path: str):
+    """Future callback that logs a background save which returned False or raised."""
+    def done(fut):
+        log = logging.getLogger("ThermalLogger")
+        try:
+            ok = fut.result()
+        except Exception as e:
+            log.error("Save failed: %s (%s)", final_path, e)
+            return
+        if not ok:
+            log.error("Save failed: %s", final_path)
+    return done
+
+def atomic_save_npy(arr: np.ndarray, final_path: str) -> bool:
+    # raw radiometric frames: plain .npy (no zlib), readable with np.load(mmap_mode="r")
+    tmp = tmp_path_for(final_path)
+    try:
+        with open(tmp, "wb") as f:
+            np.save(f, arr, allow_pickle=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, final_path)
+        return True
+    except Exception:
+        return False
+    finally:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+NMEA_PREFIXES = (b"$GPRMC", b"$GPGGA")   # only sentences carrying a fix are decoded
+NMEA_MAX_PARTIAL = 256                      # cap on buffered bytes of an unterminated sentence
+
 class GPSReader:
     def __init__(self, port="/dev/serial0", baud=9600, timeout=1):
         self.enabled = HAS_GPS
+        self._partial = b""   # trailing bytes of a sentence not yet terminated
         if not HAS_GPS:
             self.ser = None
             return
@@ -117,27 +171,48 @@ class GPSReader:
             self.ser = None
 
     def read(self):
-        if not self.enabled or self.ser is None or not self.ser.in_waiting:
-            return None
-        line = self.ser.readline().decode("ascii", errors="ignore")
-        if not (line.startswith("$GPRMC") or line.startswith("$GPGGA")):
+        """Non-blocking: parse the sentences already buffered and return the latest fix."""
+        if not self.enabled or self.ser is None:
             return None
-        try:
-            msg = pynmea2.parse(line)
-            if hasattr(msg, "latitude") and hasattr(msg, "longitude"):
-                return {"lat": msg.latitude, "lon": msg.longitude}
-        except Exception:
+        ready, _, _ = select.select([self.ser], [], [], 0)
+        if not ready:
             return None
-        return None
+        # one read of what has arrived, never readline(): that waits out the port timeout on a partial line
+        data = self._partial + self.ser.read(self.ser.in_waiting)
+        *lines, self._partial = data.split(b"\n")
+        self._partial = self._partial[-NMEA_MAX_PARTIAL:]   # a sentence is <= 82 bytes; drop runaway noise
+        fix = None
+        for raw in lines:
+            if not raw.startswith(NMEA_PREFIXES):
+                continue
+            try:
+                msg = pynmea2.parse(raw.decode("ascii", errors="ignore"))
+                if hasattr(msg, "latitude") and hasattr(msg, "longitude"):
+                    fix = {"lat": msg.latitude, "lon": msg.longitude}
+            except Exception:
+                continue
+        return fix
 
 # ===== HUD drawing (auto-fit small) =====
-def draw_small_hud(img_bgr: np.ndarray, text: str):
-    (tw, th), _ = cv2.getTextSize(text, HUD_FONT, HUD_SCALE_BASE, HUD_THICKNESS)
+HEAD_FMT = "FPS:{:.1f} Min:{:.2f}{u} Max:{:.2f}{u} Avg:{:.2f}{u}  [{}] ({})"
+
+def fit_hud_scale(frame_w: int, sample: str):
+    """Largest scale in [HUD_MIN_SCALE, HUD_SCALE_BASE] fitting `sample`; returns (scale, y)."""
+    avail = frame_w - 2 * HUD_MARGIN_X
     scale = HUD_SCALE_BASE
-    while tw > (img_bgr.shape[1] - 2 * HUD_MARGIN_X) and scale > HUD_MIN_SCALE:
-        scale -= 0.02
-        (tw, th), _ = cv2.getTextSize(text, HUD_FONT, scale, HUD_THICKNESS)
-    y = max(HUD_Y, th + 2)
+    if cv2.getTextSize(sample, HUD_FONT, scale, HUD_THICKNESS)[0][0] > avail:
+        lo, hi = HUD_MIN_SCALE, HUD_SCALE_BASE
+        for _ in range(8):
+            mid = (lo + hi) / 2
+            if cv2.getTextSize(sample, HUD_FONT, mid, HUD_THICKNESS)[0][0] <= avail:
+                lo = mid
+            else:
+                hi = mid
+        scale = lo
+    (_, th), _ = cv2.getTextSize(sample, HUD_FONT, scale, HUD_THICKNESS)
+    return scale, max(HUD_Y, th + 2)
+
+def draw_small_hud(img_bgr: np.ndarray, text: str, scale: float, y: int):
     cv2.putText(img_bgr, text, (HUD_MARGIN_X, y), HUD_FONT, scale, (255, 255, 255), HUD_THICKNESS, cv2.LINE_AA)
 
 def main():
@@ -151,16 +226,11 @@ def main():
         handlers=[logging.FileHandler(log_path, encoding="utf-8"), logging.StreamHandler(sys.stdout)],
     )
     log = logging.getLogger("ThermalLogger")
-    log.info(f"Run directory: {run_dir}")
+    log.info("Run directory: %s", run_dir)
 
-    if not os.path.exists(csv_path):
-        with open(csv_path, "w", newline="") as f:
-            csv.writer(f).writerow([
-                "utc_ts","filename","colormap","mode","units",
-                "frame_min","frame_max","frame_avg",
-                "roi_min","roi_max","roi_mean",
-                "roi_x1","roi_y1","roi_x2","roi_y2","lat","lon"
-            ])
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(CV_THREADS)
+    log.info("OpenCV threads: %d (optimized=%s)", cv2.getNumThreads(), cv2.useOptimized())
 
     cam = ThermalCamera()
     gps = GPSReader()
@@ -174,109 +244,154 @@ def main():
         (cv2.COLORMAP_PLASMA,  "PLASMA"),
     ]
     cmap_idx = 0
+    # 256x1x3 colormap tables, built once and applied with cv2.LUT
+    luts = [cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(-1, 1), code)
+            for code, _ in colormaps]
+    # widest HUD line we can produce; the HUD scale is fitted to it once per frame size
+    hud_sample = HEAD_FMT.format(99.9, -999.99, 999.99, 999.99,
+                                 max((name for _, name in colormaps), key=len), "radiometric", u="C")
 
     if PREVIEW:
         cv2.namedWindow("Thermal Logger", cv2.WINDOW_NORMAL)
 
-    last_save = 0.0
-    last_gps  = 0.0
-    t_prev    = time.time()
+    metric_buf = None   # °C image reused across radiometric frames
+    blur_buf   = None   # hottest_box scratch, sized on first frame
+    bgr_buf    = None   # gray8 expanded to 3 channels for cv2.LUT
+    colorized  = None   # reused colorized output frame
+
+    # loop timing runs on the monotonic clock; NTP steps can't stall or skip saves
+    monotonic = time.monotonic
+    sleep     = time.sleep
+    last_save = float("-inf")
+    last_gps  = float("-inf")
+    t_prev    = monotonic()
     fps       = 0.0
 
     log.info("Keys: s=save  c=next colormap  q=quit")
-    running = True
-    while running:
-        t0 = time.time()
 
-        # radiometry-first; fallback to 8-bit if needed
-        try:
-            frame16     = cam.capture_frame16()
-            metric_img  = cam.to_celsius_from_tlinear(frame16)   # °C
-            gray8       = cam.to_display_8bit_from_16(frame16)   # for color maps
-            mode, units = "radiometric", "C"
-        except Exception:
-            gray8       = cam.capture_frame()
-            metric_img  = gray8.astype(np.float32)
-            frame16     = None
-            mode, units = "8bit", "raw"
-
-        cmap_code, cmap_name = colormaps[cmap_idx]
-        colorized = cv2.applyColorMap(gray8, cmap_code)
-
-        # hot anomaly box & floating avg label
-        roi = hottest_box(metric_img, HOT_BOX_SIZE)
-        cv2.rectangle(colorized, (roi["x1"], roi["y1"]), (roi["x2"], roi["y2"]), (255, 255, 255), 1)
-        float_label = f"{roi['mean']:.2f}{'C' if mode=='radiometric' else ''}"
-        lx = min(colorized.shape[1] - 60, max(0, roi["x2"] + 4))
-        ly = max(12, roi["y1"] - 6)
-        cv2.putText(colorized, float_label, (lx, ly), HUD_FONT, 0.45, (255, 255, 255), 1, cv2.LINE_AA)
-
-        # FPS EMA
-        dt  = t0 - t_prev
-        fps = (0.9 * fps + 0.1 * (1.0/dt)) if dt > 0 else fps
-        t_prev = t0
-
-        # HUD top line
-        head = (f"FPS:{fps:.1f} "
-                f"Min:{metric_img.min():.2f}{'C' if mode=='radiometric' else ''} "
-                f"Max:{metric_img.max():.2f}{'C' if mode=='radiometric' else ''} "
-                f"Avg:{metric_img.mean():.2f}{'C' if mode=='radiometric' else ''}  "
-                f"[{cmap_name}] ({mode})")
-        draw_small_hud(colorized, head)
-
-        if PREVIEW:
-            cv2.imshow("Thermal Logger", colorized)
-
-        key = cv2.waitKey(1) & 0xFF if PREVIEW else 255
-        if key == ord('q'):
-            running = False
-        elif key == ord('c'):
-            cmap_idx = (cmap_idx + 1) % len(colormaps)
-        elif key == ord('s'):
-            last_save = 0  # force save now
-
-        # Save on interval
-        if time.time() - last_save >= THERMAL_INTERVAL:
-            ts = utcstamp()
-
-            # colorized save (with HUD/ROI)
-            fname_color = f"{ts}_{cmap_name}.{IMAGE_FORMAT}"
-            path_color  = os.path.join(run_dir, fname_color)
-            if not atomic_save(colorized, path_color):
-                time.sleep(0.2); atomic_save(colorized, path_color)
-
-            # raw16 save if radiometric
-            if frame16 is not None:
-                raw16_path = os.path.join(run_dir, f"{ts}_raw16.png")
-                atomic_save(frame16, raw16_path)
-
-            # GPS once per save window
-            g = gps.read() if (time.time() - last_gps >= GPS_INTERVAL) else None
-            if g: last_gps = time.time()
-            lat = g["lat"] if g else ""
-            lon = g["lon"] if g else ""
-
-            fr_min = float(metric_img.min())
-            fr_max = float(metric_img.max())
-            fr_avg = float(metric_img.mean())
-
-            if mode == "radiometric":
-                logging.info(
-                    f"THERMAL | {ts} | {cmap_name} → {os.path.basename(path_color)} | mode=radiometric units=C "
-                    f"frame_min={fr_min:.2f}C frame_max={fr_max:.2f}C frame_avg={fr_avg:.2f}C "
-                    f"roi_min={roi['min']:.2f}C roi_max={roi['max']:.2f}C roi_mean={roi['mean']:.2f}C "
-                    f"roi=({roi['x1']},{roi['y1']})-({roi['x2']},{roi['y2']}) gps=({lat},{lon})"
-                )
-            else:
-                logging.info(
-                    f"THERMAL | {ts} | {cmap_name} → {os.path.basename(path_color)} | mode=8bit units=raw "
-                    f"frame_min={fr_min:.0f} frame_max={fr_max:.0f} frame_avg={fr_avg:.1f} "
-                    f"roi_min={roi['min']:.0f} roi_max={roi['max']:.0f} roi_mean={roi['mean']:.1f} "
-                    f"roi=({roi['x1']},{roi['y1']})-({roi['x2']},{roi['y2']}) gps=({lat},{lon})"
-                )
-
-            with open(csv_path, "a", newline="") as f:
-                csv.writer(f).writerow([
+    # index.csv stays open for the whole run; header only when the file is new
+    csv_file   = open(csv_path, "a", newline="", buffering=1 << 15)
+    csv_writer = csv.writer(csv_file)
+    if csv_file.tell() == 0:
+        csv_writer.writerow([
+            "utc_ts","filename","colormap","mode","units",
+            "frame_min","frame_max","frame_avg",
+            "roi_min","roi_max","roi_mean",
+            "roi_x1","roi_y1","roi_x2","roi_y2","lat","lon"
+        ])
+
+    # encode + fsync happen on a worker so saves don't stall the preview loop
+    save_pool = ThreadPoolExecutor(max_workers=1)
+
+    running = True
+    try:
+        while running:
+            now = monotonic()
+
+            # radiometry-first; fallback to 8-bit if needed
+            try:
+                frame16     = cam.capture_frame16()
+                if metric_buf is None or metric_buf.shape != frame16.shape:
+                    metric_buf = np.empty(frame16.shape, np.float32)
+                # the camera owns the TLinear calibration; only the float32 destination is reused
+                np.copyto(metric_buf, cam.to_celsius_from_tlinear(frame16))
+                metric_img  = metric_buf   # °C
+                gray8       = cam.to_display_8bit_from_16(frame16)   # for color maps
+                mode, units = "radiometric", "C"
+            except Exception:
+                gray8       = cam.capture_frame()
+                metric_img  = gray8.astype(np.float32)
+                frame16     = None
+                mode, units = "8bit", "raw"
+
+            cmap_name = colormaps[cmap_idx][1]
+            if colorized is None or colorized.shape[:2] != gray8.shape[:2]:
+                bgr_buf   = np.empty(gray8.shape[:2] + (3,), np.uint8)
+                colorized = np.empty_like(bgr_buf)
+                hud_scale, hud_y = fit_hud_scale(colorized.shape[1], hud_sample)
+            cv2.cvtColor(gray8, cv2.COLOR_GRAY2BGR, dst=bgr_buf)
+            cv2.LUT(bgr_buf, luts[cmap_idx], dst=colorized)
+
+            # hot anomaly box & floating avg label
+            if blur_buf is None or blur_buf.shape != metric_img.shape[:2]:
+                blur_buf = np.empty(metric_img.shape[:2], np.float32)
+            roi = hottest_box(metric_img, HOT_BOX_SIZE, blur_buf)
+            cv2.rectangle(colorized, (roi["x1"], roi["y1"]), (roi["x2"], roi["y2"]), (255, 255, 255), 1)
+            float_label = f"{roi['mean']:.2f}{'C' if mode=='radiometric' else ''}"
+            lx = min(colorized.shape[1] - 60, max(0, roi["x2"] + 4))
+            ly = max(12, roi["y1"] - 6)
+            cv2.putText(colorized, float_label, (lx, ly), HUD_FONT, 0.45, (255, 255, 255), 1, cv2.LINE_AA)
+
+            # FPS EMA
+            dt  = now - t_prev
+            fps = (0.9 * fps + 0.1 * (1.0/dt)) if dt > 0 else fps
+            t_prev = now
+
+            # HUD top line
+            # frame stats: single pass each for min/max and mean, shared by the HUD and the save row
+            fr_min, fr_max, _, _ = cv2.minMaxLoc(metric_img)
+            fr_avg = cv2.mean(metric_img)[0]
+            head = HEAD_FMT.format(fps, fr_min, fr_max, fr_avg,
+                                   cmap_name, mode, u="C" if mode == "radiometric" else "")
+            draw_small_hud(colorized, head, hud_scale, hud_y)
+
+            if PREVIEW:
+                cv2.imshow("Thermal Logger", colorized)
+
+            key = cv2.waitKey(1) & 0xFF if PREVIEW else 255
+            if key != 0xFF:   # no key pressed is the common case
+                if key == ord('q'):
+                    running = False
+                elif key == ord('c'):
+                    cmap_idx = (cmap_idx + 1) % len(colormaps)
+                elif key == ord('s'):
+                    last_save = float("-inf")  # force save now
+
+            # Save on interval
+            if now - last_save >= THERMAL_INTERVAL:
+                ts = utcstamp()
+
+                # colorized save (with HUD/ROI)
+                fname_color = f"{ts}_{cmap_name}.{IMAGE_FORMAT}"
+                path_color  = os.path.join(run_dir, fname_color)
+                # copy: colorized is reused by the next frame while the worker encodes it
+                fut = save_pool.submit(save_with_retry, colorized.copy(), path_color)
+                fut.add_done_callback(on_save_done(path_color))
+
+                # raw16 save if radiometric
+                if frame16 is not None:
+                    raw16_path = os.path.join(run_dir, f"{ts}_raw16.npy")
+                    fut = save_pool.submit(atomic_save_npy, frame16, raw16_path)
+                    fut.add_done_callback(on_save_done(raw16_path))
+
+                # GPS once per save window
+                g = gps.read() if (now - last_gps >= GPS_INTERVAL) else None
+                if g: last_gps = now
+                lat = g["lat"] if g else ""
+                lon = g["lon"] if g else ""
+
+                if mode == "radiometric":
+                    log.info(
+                        "THERMAL | %s | %s → %s | mode=radiometric units=C "
+                        "frame_min=%.2fC frame_max=%.2fC frame_avg=%.2fC "
+                        "roi_min=%.2fC roi_max=%.2fC roi_mean=%.2fC "
+                        "roi=(%d,%d)-(%d,%d) gps=(%s,%s)",
+                        ts, cmap_name, fname_color, fr_min, fr_max, fr_avg,
+                        roi["min"], roi["max"], roi["mean"],
+                        roi["x1"], roi["y1"], roi["x2"], roi["y2"], lat, lon
+                    )
+                else:
+                    log.info(
+                        "THERMAL | %s | %s → %s | mode=8bit units=raw "
+                        "frame_min=%.0f frame_max=%.0f frame_avg=%.1f "
+                        "roi_min=%.0f roi_max=%.0f roi_mean=%.1f "
+                        "roi=(%d,%d)-(%d,%d) gps=(%s,%s)",
+                        ts, cmap_name, fname_color, fr_min, fr_max, fr_avg,
+                        roi["min"], roi["max"], roi["mean"],
+                        roi["x1"], roi["y1"], roi["x2"], roi["y2"], lat, lon
+                    )
+
+                csv_writer.writerow([
                     ts, os.path.basename(path_color), cmap_name,
                     mode, units,
                     f"{fr_min:.4f}", f"{fr_max:.4f}", f"{fr_avg:.4f}",
@@ -284,19 +399,26 @@ def main():
                     roi["x1"], roi["y1"], roi["x2"], roi["y2"],
                     lat, lon
                 ])
-
-            # rotate colormap
-            cmap_idx = (cmap_idx + 1) % len(colormaps)
-            last_save = time.time()
-
-        # periodic GPS line even without a save
-        if time.time() - last_gps >= GPS_INTERVAL:
-            ts = utcstamp()
-            g = gps.read()
-            logging.info(f"GPS     | {ts} | {g['lat']}, {g['lon']}" if g else f"GPS     | {ts} | unavailable")
-            last_gps = time.time()
-
-        time.sleep(0.01)
+                csv_file.flush()
+
+                # rotate colormap
+                cmap_idx = (cmap_idx + 1) % len(colormaps)
+                last_save = now
+
+            # periodic GPS line even without a save
+            if now - last_gps >= GPS_INTERVAL:
+                ts = utcstamp()
+                g = gps.read()
+                if g:
+                    log.info("GPS     | %s | %s, %s", ts, g["lat"], g["lon"])
+                else:
+                    log.info("GPS     | %s | unavailable", ts)
+                last_gps = now
+
+            sleep(0.01)
+    finally:
+        save_pool.shutdown(wait=True)
+        csv_file.close()
 
     if PREVIEW:
         cv2.destroyAllWindows()
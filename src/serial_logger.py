@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
+import select
 import serial
 import time
 import os
 from datetime import datetime
+from config import GPS_RE, RTC_RE
 from data_logger import DataLogger
 
 class SerialReader:
@@ -10,11 +12,14 @@ class SerialReader:
         self.port = port
         self.baud_rate = baud_rate
         self.serial = None
+        self._poll = None
         self.logger = DataLogger()
 
     def connect(self):
         try:
             self.serial = serial.Serial(self.port, self.baud_rate)
+            self._poll = select.poll()
+            self._poll.register(self.serial.fileno(), select.POLLIN)
             print(f"Connected to {self.port}")
             return True
         except Exception as e:
@@ -27,36 +32,35 @@ class SerialReader:
                 return
 
         try:
-            line = self.serial.readline().decode('utf-8').strip()
+            line = self.serial.readline().strip()
             if not line:
                 return
 
             # Parse the line based on the format
-            parts = line.split(',')
-            if len(parts) < 2:
+            if not line.startswith(b'DATA,'):
+                if b',' in line:
+                    print(f"Status: {line.decode('utf-8', 'replace')}")  # Print status messages
                 return
 
-            if parts[0] != 'DATA':
-                print(f"Status: {line}")  # Print status messages
-                return
-
-            data_type = parts[1]
-            if data_type == 'GPS' and len(parts) >= 7:
+            m = GPS_RE.match(line)
+            if m:
                 # GPS data format: DATA,GPS,timestamp,lat,lon,alt,sats
                 gps_data = {
-                    'timestamp': parts[2],
-                    'latitude': float(parts[3]),
-                    'longitude': float(parts[4]),
-                    'altitude': float(parts[5]),
-                    'satellites': int(parts[6])
+                    'timestamp': m.group(1).decode('ascii', 'replace'),
+                    'latitude': float(m.group(2)),
+                    'longitude': float(m.group(3)),
+                    'altitude': float(m.group(4)),
+                    'satellites': int(m.group(5))
                 }
                 self.logger.log_data('gps', gps_data)
                 print(f"Logged GPS data: {gps_data}")
+                return
 
-            elif data_type == 'RTC' and len(parts) >= 3:
+            m = RTC_RE.match(line)
+            if m:
                 # RTC data format: DATA,RTC,timestamp
                 rtc_data = {
-                    'timestamp': parts[2]
+                    'timestamp': m.group(1).decode('ascii', 'replace')
                 }
                 self.logger.log_data('time', rtc_data)
                 print(f"Logged RTC data: {rtc_data}")
@@ -66,9 +70,26 @@ class SerialReader:
 
     def run(self):
         print("Starting serial reader...")
+        if not self.serial and not self.connect():
+            return
         while True:
-            self.read_and_log()
-            time.sleep(0.1)  # Small delay to prevent CPU overuse
+            try:
+                # Block until the port is readable, then drain every pending line
+                if not self._poll.poll(1000):
+                    continue
+                while self.serial.in_waiting:
+                    self.read_and_log()
+            except Exception as e:
+                print(f"Error reading serial: {e}")
+                # Port unplugged or hung up: drop it and try to reconnect
+                try:
+                    self.serial.close()
+                except Exception:
+                    pass
+                self.serial = None
+                time.sleep(5)
+                while not self.connect():
+                    time.sleep(5)
 
 if __name__ == "__main__":
     # Try common USB ports for Arduino
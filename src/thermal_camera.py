@@ -4,10 +4,12 @@
 import argparse
 from pathlib import Path
 import csv
-from datetime import datetime
 import os
+import queue
 import sys
+import threading
 import time
+import traceback
 import cv2
 import numpy as np
 from thermal_camera import ThermalCamera
@@ -34,31 +36,144 @@ def append_csv(path: Path, row: list):
         csv.writer(f).writerow(row)
 
 def gee_timestamp():
-    return datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-
-def hottest_box(metric_img: np.ndarray, box_size: int):
-    img = metric_img.astype(np.float32, copy=False)
-    img_blur = cv2.GaussianBlur(img, (3, 3), 0)
-    _, _, _, maxLoc = cv2.minMaxLoc(img_blur)
-    cx, cy = int(maxLoc[0]), int(maxLoc[1])
-    h, w = img.shape[:2]
+    return time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+
+def hottest_box(metric_img: np.ndarray, box_size: int, search_img=None, box_dst=None):
+    # Hot spot = argmax of a 3x3 mean over search_img (defaults to metric_img); pass the integer
+    # frame it came from to skip any float work. box_dst: optional reusable output buffer.
+    src = metric_img if search_img is None else search_img
+    img_box = cv2.boxFilter(src, -1, (3, 3), dst=box_dst, normalize=True)
+    h, w = img_box.shape[:2]
+    cy, cx = divmod(int(img_box.argmax()), w)
     half = max(2, box_size // 2)
     x1 = max(0, cx - half); y1 = max(0, cy - half)
     x2 = min(w, cx + half); y2 = min(h, cy + half)
-    roi = img[y1:y2, x1:x2]
+    roi = metric_img[y1:y2, x1:x2]
+    fr_min, fr_max, _, _ = cv2.minMaxLoc(metric_img)   # whole-frame stats for the HUD / CSV
     return {"min": float(roi.min()), "max": float(roi.max()), "mean": float(roi.mean()),
-            "x1": x1, "y1": y1, "x2": x2, "y2": y2, "cx": cx, "cy": cy}
+            "x1": x1, "y1": y1, "x2": x2, "y2": y2, "cx": cx, "cy": cy,
+            "frame_min": fr_min, "frame_max": fr_max, "frame_mean": cv2.mean(metric_img)[0]}
+
+def save_worker(save_q: queue.Queue):
+    """Encode and write queued (path, image) saves off the UI thread."""
+    while True:
+        path, img = save_q.get()
+        try:
+            if cv2.imwrite(str(path), img):
+                print(f"Saved {Path(path).name}")
+            else:
+                print(f"Failed to save {Path(path).name}")
+        except Exception as e:   # keep consuming: a dead worker would hang save_q.join() on exit
+            print(f"Failed to save {Path(path).name}: {e}")
+        finally:
+            save_q.task_done()
+
+def put_latest(q: queue.Queue, item):
+    """Non-blocking put that drops the oldest queued item when the consumer falls behind."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+def run_stage(target, stop: threading.Event, *args):
+    """Thread body for a pipeline stage: report any error and stop the pipeline instead of dying silently."""
+    try:
+        target(*args)
+    except Exception:
+        print(f"{target.__name__} failed:", file=sys.stderr)
+        traceback.print_exc()
+        stop.set()
+
+def capture_loop(cam, q_raw: queue.Queue, stop: threading.Event):
+    """Stage 1: grab frames (radiometric if available) and hand them to processing."""
+    while not stop.is_set():
+        mode, units = "8bit", "raw"
+        metric_img  = None
+        color_src   = None
+        frame16     = None
+
+        if cam.is_radiometric():
+            try:
+                frame16    = cam.capture_frame16()
+                metric_img = ThermalCamera.to_celsius_from_tlinear(frame16)
+                color_src  = ThermalCamera.to_display_8bit_from_16(frame16)
+                mode, units = "radiometric", "C"
+            except Exception:
+                pass
+
+        if metric_img is None or color_src is None:
+            frame8     = cam.capture_frame()
+            metric_img = frame8.astype(np.float32)
+            color_src  = frame8
+
+        put_latest(q_raw, (frame16, metric_img, color_src, mode, units))
+
+def process_loop(q_raw: queue.Queue, q_disp: queue.Queue, state: dict, luts, cmap_names,
+                 box_size: int, stop: threading.Event):
+    """Stage 2: ROI search, colormap and HUD; hands finished frames to the display."""
+    t_prev = time.monotonic()
+    box_dst = None   # hottest_box output buffer, sized on first frame
+    bgr_buf = None   # color_src expanded to 3 channels for cv2.LUT (scratch, never handed on)
+    while not stop.is_set():
+        try:
+            frame16, metric_img, color_src, mode, units = q_raw.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        cmap_idx = state["cmap_idx"]
+
+        # TLinear (uint16) / 8-bit frames order pixels exactly like metric_img, so search those
+        search = frame16 if mode == "radiometric" else color_src
+        if box_dst is None or box_dst.shape != search.shape or box_dst.dtype != search.dtype:
+            box_dst = np.empty_like(search)
+        roi = hottest_box(metric_img, box_size, search, box_dst)
+        if bgr_buf is None or bgr_buf.shape[:2] != color_src.shape[:2]:
+            bgr_buf = np.empty(color_src.shape[:2] + (3,), np.uint8)
+        cv2.cvtColor(color_src, cv2.COLOR_GRAY2BGR, dst=bgr_buf)
+        colorized = cv2.LUT(bgr_buf, luts[cmap_idx])   # fresh array: it goes to the display/save queues
+        cv2.rectangle(colorized, (roi["x1"], roi["y1"]), (roi["x2"], roi["y2"]), (255,255,255), 1)
+
+        # Floating avg near ROI center
+        avg_text = f"{roi['mean']:.2f}{units}" if mode == "radiometric" else f"{roi['mean']:.1f}"
+        cv2.putText(colorized, avg_text, (roi["cx"]+5, roi["cy"]-5), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255,255,255), 1)
+
+        fr_min, fr_max, fr_avg = roi["frame_min"], roi["frame_max"], roi["frame_mean"]
+        now = time.monotonic()
+        fps = 1.0 / max(1e-6, (now - t_prev))
+        t_prev = now
+
+        # Small HUD at top
+        head = (f"FPS:{fps:.1f} "
+                f"Min:{fr_min:.2f}{'C' if mode=='radiometric' else ''} "
+                f"Max:{fr_max:.2f}{'C' if mode=='radiometric' else ''} "
+                f"Avg:{fr_avg:.2f}{'C' if mode=='radiometric' else ''}  "
+                f"[{cmap_names[cmap_idx]}]")
+        cv2.putText(colorized, head, (5, 15), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255,255,255), 1)
+
+        put_latest(q_disp, {
+            "colorized": colorized, "frame16": frame16, "metric_img": metric_img,
+            "roi": roi, "fr_min": fr_min, "fr_max": fr_max, "fr_avg": fr_avg,
+            "cmap_idx": cmap_idx, "mode": mode, "units": units,
+        })
 
 def main():
     args = parse_args()
 
     base_dir = Path(args.output_dir)
-    today    = datetime.utcnow().strftime("%Y%m%d")
+    today    = time.strftime("%Y%m%d", time.gmtime())
     day_dir  = base_dir / today
     day_dir.mkdir(parents=True, exist_ok=True)
     log_file = day_dir / args.log_file
     init_csv(log_file)
 
+    # tiny Lepton frames: thread-pool dispatch costs more than it saves (THERMAL_CV_THREADS overrides)
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(int(os.environ.get("THERMAL_CV_THREADS", "1")))
+
     cam = ThermalCamera()
     cv2.namedWindow("FLIR Lepton 3.5", cv2.WINDOW_NORMAL)
 
@@ -67,83 +182,85 @@ def main():
         cv2.COLORMAP_RAINBOW, cv2.COLORMAP_INFERNO
     ]
     cmap_names = ["JET","TURBO","HOT","RAINBOW","INFERNO"]
-    cmap_idx   = 0
+    # 256x1x3 colormap tables, built once and applied with cv2.LUT
+    luts = [cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(-1, 1), cm)
+            for cm in colormaps]
+    state      = {"cmap_idx": 0}   # written by the UI thread, read by processing
     box_size   = max(4, int(args.box))
 
+    # capture -> process -> display (this thread: OpenCV UI must stay on the main thread);
+    # small queues that drop the oldest frame keep the display on the newest one
+    stop   = threading.Event()
+    q_raw  = queue.Queue(maxsize=2)
+    q_disp = queue.Queue(maxsize=2)
+    workers = [
+        threading.Thread(target=run_stage, args=(capture_loop, stop, cam, q_raw, stop), daemon=True),
+        threading.Thread(target=run_stage,
+                         args=(process_loop, stop, q_raw, q_disp, state, luts, cmap_names, box_size, stop),
+                         daemon=True),
+    ]
+    for t in workers:
+        t.start()
+
+    # image encoding for 's' saves runs here so the display never waits on it
+    save_q = queue.Queue()
+    threading.Thread(target=save_worker, args=(save_q,), daemon=True).start()
+
+    shown = None
+    failed = False
     try:
         while True:
-            t0 = time.time()
-            mode, units = "8bit", "raw"
-            metric_img  = None
-            color_src   = None
-            frame16     = None
-
-            if cam.is_radiometric():
-                try:
-                    frame16    = cam.capture_frame16()
-                    metric_img = ThermalCamera.to_celsius_from_tlinear(frame16)
-                    color_src  = ThermalCamera.to_display_8bit_from_16(frame16)
-                    mode, units = "radiometric", "C"
-                except Exception:
-                    pass
-
-            if metric_img is None or color_src is None:
-                frame8     = cam.capture_frame()
-                metric_img = frame8.astype(np.float32)
-                color_src  = frame8
-
-            roi = hottest_box(metric_img, box_size)
-            colorized = cv2.applyColorMap(color_src, colormaps[cmap_idx])
-            cv2.rectangle(colorized, (roi["x1"], roi["y1"]), (roi["x2"], roi["y2"]), (255,255,255), 1)
-
-            # Floating avg near ROI center
-            avg_text = f"{roi['mean']:.2f}{units}" if mode == "radiometric" else f"{roi['mean']:.1f}"
-            cv2.putText(colorized, avg_text, (roi["cx"]+5, roi["cy"]-5), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255,255,255), 1)
-
-            fr_min, fr_max, fr_avg = metric_img.min(), metric_img.max(), metric_img.mean()
-            fps = 1.0 / max(1e-6, (time.time() - t0))
-
-            # Small HUD at top
-            head = (f"FPS:{fps:.1f} "
-                    f"Min:{fr_min:.2f}{'C' if mode=='radiometric' else ''} "
-                    f"Max:{fr_max:.2f}{'C' if mode=='radiometric' else ''} "
-                    f"Avg:{fr_avg:.2f}{'C' if mode=='radiometric' else ''}  "
-                    f"[{cmap_names[cmap_idx]}]")
-            cv2.putText(colorized, head, (5, 15), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255,255,255), 1)
-
-            cv2.imshow("FLIR Lepton 3.5", colorized)
+            # a stage that hit an error has already printed it; don't keep showing a stale frame
+            if stop.is_set() or not all(t.is_alive() for t in workers):
+                failed = True
+                break
+            try:
+                shown = q_disp.get(timeout=0.1)
+                cv2.imshow("FLIR Lepton 3.5", shown["colorized"])
+            except queue.Empty:
+                pass
 
             key = cv2.waitKey(10) & 0xFF
-            if key == ord('s'):
+            if key == 0xFF:
+                continue   # no key pressed: the common case, skip the key checks
+
+            if key == ord('s') and shown is not None:
                 ts = gee_timestamp()
                 raw_name   = f"flir_{ts}.tif"
                 color_name = f"flir_{ts}_color.tif"
                 raw_path   = day_dir / raw_name
                 color_path = day_dir / color_name
+                mode, units, roi = shown["mode"], shown["units"], shown["roi"]
 
-                if mode == "radiometric" and frame16 is not None:
-                    cv2.imwrite(str(raw_path), frame16)
+                # frames handed over by the pipeline are never written to again, so no copies needed
+                if mode == "radiometric" and shown["frame16"] is not None:
+                    save_q.put((raw_path, shown["frame16"]))
                 else:
-                    cv2.imwrite(str(raw_path), (metric_img.clip(0,255)).astype(np.uint8))
-                cv2.imwrite(str(color_path), colorized)
+                    save_q.put((raw_path, (shown["metric_img"].clip(0,255)).astype(np.uint8)))
+                save_q.put((color_path, shown["colorized"]))
 
                 append_csv(log_file, [
                     ts, str(raw_path),
-                    float(fr_min), float(fr_max), float(fr_avg),
-                    cmap_names[cmap_idx],
+                    float(shown["fr_min"]), float(shown["fr_max"]), float(shown["fr_avg"]),
+                    cmap_names[shown["cmap_idx"]],
                     roi["min"], roi["max"], roi["mean"],
                     roi["x1"], roi["y1"], roi["x2"], roi["y2"],
                     mode, units
                 ])
-                print(f"Saved {raw_path.name} and {color_path.name}")
 
             elif key == ord('c'):
-                cmap_idx = (cmap_idx + 1) % len(colormaps)
+                state["cmap_idx"] = (state["cmap_idx"] + 1) % len(colormaps)
             elif key == ord('q'):
                 break
 
     finally:
+        stop.set()
+        for t in workers:
+            t.join(timeout=1.0)
+        save_q.join()   # finish pending saves before exiting
         cv2.destroyAllWindows()
+    if failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import atexit
+import threading
 import cv2
 import numpy as np
 import time
@@ -17,10 +19,26 @@ class ThermalProcessor:
             cv2.COLORMAP_INFERNO,
             cv2.COLORMAP_RAINBOW
         ]
+        # 256x1x3 colormap tables applied with cv2.LUT, built on first use of each colormap
+        self._luts = {}
+        # Raw frames are batched here and written as one compressed .npz per batch.
+        # Up to _save_flush_size frames exist only in RAM until their batch is written
+        # (lost on a crash or power cut), so keep the batch small for a logger.
+        self._save_ring = []
+        self._save_flush_size = 10
+        self._save_path = None
+        self._save_thread = None
+        atexit.register(self.flush)
         
     def process_frame(self, frame):
         """Process thermal frame with colormap"""
-        colored = cv2.applyColorMap(frame, self.current_colormap)
+        cm = self.current_colormap
+        lut = self._luts.get(cm)
+        if lut is None:
+            lut = self._luts[cm] = cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(-1, 1), cm)
+        # applyColorMap maps colour input through its gray level; do the same
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        colored = cv2.LUT(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR), lut)
         min_temp = frame.min()
         max_temp = frame.max()
         avg_temp = frame.mean()
@@ -33,13 +51,24 @@ class ThermalProcessor:
         return colored
         
     def save_frame(self, frame, colored_frame=None):
-        """Save both raw and colored frames"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """Save both raw and colored frames.
+
+        Returns (batch_path, index): the raw frame is frames[index] in the .npz at
+        batch_path. That file is written only once the batch fills or flush() runs,
+        so it may not exist yet when this returns.
+        """
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        frame_ts = now.strftime("%Y%m%d_%H%M%S_%f")   # per-frame: several frames land in one second
         
-        # Save raw frame
-        raw_path = os.path.join(self.logger.data_dirs['thermal'], 
-                               f'thermal_raw_{timestamp}.npy')
-        np.save(raw_path, frame)
+        # Queue raw frame; the batch file is named after its first frame
+        if not self._save_ring:
+            self._save_path = os.path.join(self.logger.data_dirs['thermal'],
+                                           f'thermal_{frame_ts}.npz')
+        raw_path, index = self._save_path, len(self._save_ring)
+        self._save_ring.append((frame_ts, np.array(frame, copy=True)))
+        if len(self._save_ring) >= self._save_flush_size:
+            self._flush_async()
         
         # Save colored frame if provided
         if colored_frame is not None:
@@ -47,7 +76,40 @@ class ThermalProcessor:
                                       f'thermal_colored_{timestamp}.png')
             cv2.imwrite(colored_path, colored_frame)
             
-        return raw_path
+        return raw_path, index
+        
+    def _flush_async(self):
+        """Hand the pending batch to a background thread and start a new one"""
+        ring, path = self._save_ring, self._save_path
+        self._save_ring = []
+        prev = self._save_thread
+        
+        def write():
+            if prev is not None:
+                prev.join()   # keep batches on disk in capture order
+            self._write_batch(ring, path)
+        
+        # Not a daemon: interpreter exit waits for the write to finish
+        self._save_thread = threading.Thread(target=write)
+        self._save_thread.start()
+        
+    @staticmethod
+    def _write_batch(ring, path):
+        """Write (timestamp, frame) pairs as one compressed .npz"""
+        np.savez_compressed(path,
+                            frames=np.stack([f for _, f in ring]),
+                            ts=np.array([t for t, _ in ring]))
+        
+    def flush(self):
+        """Wait for pending writes, then write any partially filled batch in this thread"""
+        # No new thread here: flush also runs from atexit, where threads can't be started
+        if self._save_thread is not None:
+            self._save_thread.join()
+            self._save_thread = None
+        if self._save_ring:
+            ring, path = self._save_ring, self._save_path
+            self._save_ring = []
+            self._write_batch(ring, path)
         
     def cycle_colormap(self):
         """Cycle through available colormaps"""